@@ -8,8 +8,21 @@ sends alerts on failures, and automatically restarts services.
 __version__ = "1.0.0"
 __author__ = "Tommie Seals"
 
-from .watchdog import ServiceWatchdog
-from .config import WatchdogConfig
-from .monitor import ServiceMonitor
-
 __all__ = ["ServiceWatchdog", "WatchdogConfig", "ServiceMonitor"]
+
+# Re-exports are resolved lazily (PEP 562) so importing the package -
+# which every CLI entry point does - doesn't drag in psutil/requests/yaml
+# until something actually uses them.
+_EXPORTS = {
+    "ServiceWatchdog": ".watchdog",
+    "WatchdogConfig": ".config",
+    "ServiceMonitor": ".monitor",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        from importlib import import_module
+
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
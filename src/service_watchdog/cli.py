@@ -1,14 +1,25 @@
 """Command-line interface for Service Watchdog."""
 
-import json
 import os
 import sys
 from pathlib import Path
 
 import click
 
-from .config import WatchdogConfig
-from .watchdog import ServiceWatchdog
+# The watchdog stack (and transitively psutil/requests/yaml) is imported
+# inside each command so lightweight invocations like `init` or `--help`
+# don't pay the full import cost.
+
+
+def _json_dumps(obj) -> str:
+    """Serialize to indented JSON, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        return json.dumps(obj, indent=2)
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
 
 
 @click.group()
@@ -42,6 +53,9 @@ def main():
 )
 def run(config_path: str, daemon: bool, dry_run: bool, verbose: bool):
     """Start the watchdog daemon."""
+    from .config import WatchdogConfig
+    from .watchdog import ServiceWatchdog
+
     try:
         config = WatchdogConfig.from_yaml(config_path)
     except Exception as e:
@@ -79,6 +93,8 @@ def run(config_path: str, daemon: bool, dry_run: bool, verbose: bool):
 )
 def validate(config_path: str):
     """Validate configuration file."""
+    from .config import WatchdogConfig
+
     try:
         config = WatchdogConfig.from_yaml(config_path)
         errors = config.validate()
@@ -114,13 +130,16 @@ def validate(config_path: str):
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
 def status(config_path: str, as_json: bool):
     """Show status of monitored services."""
+    from .config import WatchdogConfig
+    from .watchdog import ServiceWatchdog
+
     try:
         config = WatchdogConfig.from_yaml(config_path)
         watchdog = ServiceWatchdog(config)
         result = watchdog.status()
 
         if as_json:
-            click.echo(json.dumps(result, indent=2))
+            click.echo(_json_dumps(result))
         else:
             click.echo("Service Watchdog Status")
             click.echo("=" * 50)
@@ -159,6 +178,8 @@ def status(config_path: str, as_json: bool):
 @click.argument("service_name")
 def restart(config_path: str, service_name: str):
     """Manually restart a service."""
+    from .config import WatchdogConfig
+
     try:
         config = WatchdogConfig.from_yaml(config_path)
 
@@ -191,7 +212,8 @@ def restart(config_path: str, service_name: str):
 @click.option("-o", "--output", type=click.Path(), help="Output file path")
 def init(output: str):
     """Generate a sample configuration file."""
-    sample_config = '''# Service Watchdog Configuration
+    # Kept as bytes so writing it skips a UTF-8 re-encoding pass
+    sample_config = b'''# Service Watchdog Configuration
 # Documentation: https://github.com/tommieseals/service-watchdog
 
 # Global settings
@@ -269,10 +291,10 @@ notifiers:
 '''
 
     if output:
-        Path(output).write_text(sample_config)
+        Path(output).write_bytes(sample_config)
         click.echo(f"✅ Sample config written to: {output}")
     else:
-        click.echo(sample_config)
+        click.echo(sample_config.decode("ascii"))
 
 
 def _daemonize():
@@ -304,11 +326,11 @@ def _daemonize():
     sys.stdout.flush()
     sys.stderr.flush()
 
-    with open("/dev/null", "r") as devnull:
-        os.dup2(devnull.fileno(), sys.stdin.fileno())
-    with open("/dev/null", "a+") as devnull:
-        os.dup2(devnull.fileno(), sys.stdout.fileno())
-        os.dup2(devnull.fileno(), sys.stderr.fileno())
+    null_fd = os.open(os.devnull, os.O_RDWR)
+    os.dup2(null_fd, sys.stdin.fileno())
+    os.dup2(null_fd, sys.stdout.fileno())
+    os.dup2(null_fd, sys.stderr.fileno())
+    os.close(null_fd)
 
 
 # Alias for watchdog-ctl
@@ -2,14 +2,59 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import os
+import re
+import shlex
+from dataclasses import MISSING, dataclass, field, fields
+from itertools import chain
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import IO, Any, Iterator, Optional, Union
 
 import yaml
 
+# Prefer the libyaml C extension when PyYAML was built with it; it parses
+# identically to SafeLoader but several times faster.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+_VAR_RE = re.compile(r"\$\{([^}]+)\}")
+
+
+def _expand_env(value: Any) -> Any:
+    """Recursively expand ``${VAR}`` references in string leaves.
+
+    Done once at load time so runtime code (notifiers in particular)
+    works with already-resolved strings. Unknown variables are left
+    as-is.
+    """
+    if isinstance(value, str):
+        return _VAR_RE.sub(lambda m: os.environ.get(m.group(1), m.group(0)), value)
+    if isinstance(value, dict):
+        return {k: _expand_env(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_expand_env(v) for v in value]
+    return value
+
+
+# Commands containing any of these need a real shell; everything else can
+# be pre-split and exec'd directly, skipping the /bin/sh fork.
+_SHELL_META_RE = re.compile(r"[;&|<>$`\"'\\*?~#(){}\[\]\n]")
+
+
+def _split_command(cmd: Optional[str]) -> Optional[list[str]]:
+    """Return an argv list for a command that needs no shell, else None."""
+    if cmd and not _SHELL_META_RE.search(cmd):
+        try:
+            argv = shlex.split(cmd)
+        except ValueError:
+            return None
+        # A leading VAR=value assignment is shell syntax, not a program
+        # to exec; those commands still need the shell
+        if argv and "=" not in argv[0]:
+            return argv
+    return None
+
+
+@dataclass(slots=True)
 class ServiceConfig:
     """Configuration for a single monitored service."""
 
@@ -39,20 +84,38 @@ class ServiceConfig:
     # Environment
     env: dict = field(default_factory=dict)
 
-    def validate(self) -> list[str]:
-        """Validate service configuration, return list of errors."""
-        errors = []
+    # Pre-split argv forms of the commands, populated in __post_init__;
+    # None means the command needs a shell (or isn't configured)
+    _start_argv: Optional[list[str]] = field(default=None, init=False, repr=False, compare=False)
+    _stop_argv: Optional[list[str]] = field(default=None, init=False, repr=False, compare=False)
+    _restart_argv: Optional[list[str]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._start_argv = _split_command(self.start_command)
+        self._stop_argv = _split_command(self.stop_command)
+        self._restart_argv = _split_command(self.restart_command)
+
+    def validate(self) -> Iterator[str]:
+        """Validate service configuration, yielding error messages.
 
+        A generator keeps the happy path allocation-free; callers that
+        need a list (or just the first error) decide how much to collect.
+        """
         if not any([self.process_name, self.pid_file, self.port, self.health_url]):
-            errors.append(f"Service '{self.name}': At least one detection method required")
+            yield f"Service '{self.name}': At least one detection method required"
 
         if self.restart_command is None and self.start_command is None:
-            errors.append(f"Service '{self.name}': restart_command or start_command required")
+            yield f"Service '{self.name}': restart_command or start_command required"
 
-        return errors
+
+# Bits for the precomputed notification mask; notifiers.should_notify
+# tests these instead of re-reading the three boolean fields per event.
+NOTIFY_FAILURE = 1
+NOTIFY_RECOVERY = 2
+NOTIFY_RESTART = 4
 
 
-@dataclass
+@dataclass(slots=True)
 class NotifierConfig:
     """Configuration for a notification channel."""
 
@@ -85,8 +148,82 @@ class NotifierConfig:
     on_recovery: bool = True
     on_restart: bool = True
 
-
-@dataclass
+    # Outbound rate limiting (requests/second and burst size); None
+    # uses the notifier type's default
+    rate_limit: Optional[float] = None
+    burst: Optional[int] = None
+
+    # Event-type bitmask derived from the on_* flags in __post_init__
+    _mask: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._mask = (
+            (NOTIFY_FAILURE if self.on_failure else 0)
+            | (NOTIFY_RECOVERY if self.on_recovery else 0)
+            | (NOTIFY_RESTART if self.on_restart else 0)
+        )
+
+
+def _make_from_mapping(cls):
+    """Generate a specialized mapping constructor for a config dataclass.
+
+    Built once at import time with exec, the same way @dataclass builds
+    __init__: a straight-line call with one membership test per field
+    replaces per-call field introspection. Unknown keys are ignored
+    because only declared fields are read, and absent keys fall back to
+    the field's default (or default_factory, called per instance).
+    """
+    namespace: dict[str, Any] = {"_cls": cls, "_expand_env": _expand_env}
+    args = []
+    for f in fields(cls):
+        if not f.init:
+            continue
+        value = f"_expand_env(data[{f.name!r}])"
+        if f.default is not MISSING:
+            namespace[f"_default_{f.name}"] = f.default
+            args.append(f"{f.name}={value} if {f.name!r} in data else _default_{f.name}")
+        elif f.default_factory is not MISSING:
+            namespace[f"_factory_{f.name}"] = f.default_factory
+            args.append(f"{f.name}={value} if {f.name!r} in data else _factory_{f.name}()")
+        else:
+            args.append(f"{f.name}={value}")
+    source = "def from_mapping(data):\n    return _cls(\n        {}\n    )\n".format(
+        ",\n        ".join(args)
+    )
+    exec(source, namespace)
+    return staticmethod(namespace["from_mapping"])
+
+
+ServiceConfig.from_mapping = _make_from_mapping(ServiceConfig)
+NotifierConfig.from_mapping = _make_from_mapping(NotifierConfig)
+
+# Keys emitted by to_dict, cached as tuples so export is a getattr loop
+# instead of hand-built dict literals re-created per call.
+_SVC_EXPORT_FIELDS = (
+    "name",
+    "enabled",
+    "process_name",
+    "pid_file",
+    "port",
+    "health_url",
+    "restart_command",
+    "restart_delay",
+    "max_restarts",
+    "check_interval",
+)
+_NOTIF_EXPORT_FIELDS = ("type", "enabled")
+_GLOBAL_EXPORT_FIELDS = (
+    "log_file",
+    "log_level",
+    "pid_file",
+    "state_file",
+    "dry_run",
+    "daemon",
+    "dedupe_window",
+)
+
+
+@dataclass(slots=True)
 class WatchdogConfig:
     """Main configuration for the watchdog daemon."""
 
@@ -103,6 +240,9 @@ class WatchdogConfig:
     dry_run: bool = False
     daemon: bool = False
 
+    # Suppress identical notifications within this window (seconds)
+    dedupe_window: int = 3600
+
     @classmethod
     def from_yaml(cls, path: Union[str, Path]) -> "WatchdogConfig":
         """Load configuration from YAML file."""
@@ -110,10 +250,15 @@ class WatchdogConfig:
         if not path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
 
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        # Open in binary mode so libyaml decodes UTF-8 itself instead of
+        # going through Python's text layer.
+        with open(path, "rb") as f:
+            return cls.from_stream(f)
 
-        return cls.from_dict(data)
+    @classmethod
+    def from_stream(cls, stream: IO) -> "WatchdogConfig":
+        """Load configuration from an open YAML stream."""
+        return cls.from_dict(yaml.load(stream, Loader=_YamlLoader))
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "WatchdogConfig":
@@ -127,53 +272,17 @@ class WatchdogConfig:
         config.state_file = data.get("state_file", config.state_file)
         config.dry_run = data.get("dry_run", config.dry_run)
         config.daemon = data.get("daemon", config.daemon)
+        config.dedupe_window = data.get("dedupe_window", config.dedupe_window)
 
-        # Parse services
+        # Parse services and notifiers through the generated
+        # constructors; ${VAR} references are resolved there, unknown
+        # keys are dropped, and defaults come from the dataclass
+        # declarations themselves.
         for svc_data in data.get("services", []):
-            svc = ServiceConfig(
-                name=svc_data["name"],
-                enabled=svc_data.get("enabled", True),
-                process_name=svc_data.get("process_name"),
-                pid_file=svc_data.get("pid_file"),
-                port=svc_data.get("port"),
-                health_url=svc_data.get("health_url"),
-                health_timeout=svc_data.get("health_timeout", 10),
-                restart_command=svc_data.get("restart_command"),
-                stop_command=svc_data.get("stop_command"),
-                start_command=svc_data.get("start_command"),
-                working_dir=svc_data.get("working_dir"),
-                restart_delay=svc_data.get("restart_delay", 60),
-                max_restarts=svc_data.get("max_restarts", 3),
-                restart_window=svc_data.get("restart_window", 3600),
-                check_interval=svc_data.get("check_interval", 30),
-                failure_threshold=svc_data.get("failure_threshold", 2),
-                env=svc_data.get("env", {}),
-            )
-            config.services.append(svc)
-
-        # Parse notifiers
+            config.services.append(ServiceConfig.from_mapping(svc_data))
+
         for notif_data in data.get("notifiers", []):
-            notif = NotifierConfig(
-                type=notif_data["type"],
-                enabled=notif_data.get("enabled", True),
-                bot_token=notif_data.get("bot_token"),
-                chat_id=notif_data.get("chat_id"),
-                webhook_url=notif_data.get("webhook_url"),
-                channel=notif_data.get("channel"),
-                smtp_host=notif_data.get("smtp_host"),
-                smtp_port=notif_data.get("smtp_port", 587),
-                smtp_user=notif_data.get("smtp_user"),
-                smtp_password=notif_data.get("smtp_password"),
-                from_addr=notif_data.get("from_addr"),
-                to_addrs=notif_data.get("to_addrs", []),
-                url=notif_data.get("url"),
-                method=notif_data.get("method", "POST"),
-                headers=notif_data.get("headers", {}),
-                on_failure=notif_data.get("on_failure", True),
-                on_recovery=notif_data.get("on_recovery", True),
-                on_restart=notif_data.get("on_restart", True),
-            )
-            config.notifiers.append(notif)
+            config.notifiers.append(NotifierConfig.from_mapping(notif_data))
 
         return config
 
@@ -184,34 +293,30 @@ class WatchdogConfig:
         if not self.services:
             errors.append("At least one service must be configured")
 
+        errors.extend(chain.from_iterable(svc.validate() for svc in self.services))
+
+        # Two services probing the same target do redundant work every
+        # cycle; flag the collision rather than silently doubling checks.
+        seen: dict[tuple, str] = {}
         for svc in self.services:
-            errors.extend(svc.validate())
+            key = (svc.process_name, svc.pid_file, svc.port, svc.health_url)
+            if not any(key):
+                continue
+            first = seen.setdefault(key, svc.name)
+            if first != svc.name:
+                errors.append(
+                    f"Service '{svc.name}': duplicate detection target (same as '{first}')"
+                )
 
         return errors
 
     def to_dict(self) -> dict[str, Any]:
         """Export configuration to dictionary."""
-        return {
-            "log_file": self.log_file,
-            "log_level": self.log_level,
-            "pid_file": self.pid_file,
-            "state_file": self.state_file,
-            "dry_run": self.dry_run,
-            "daemon": self.daemon,
-            "services": [
-                {
-                    "name": s.name,
-                    "enabled": s.enabled,
-                    "process_name": s.process_name,
-                    "pid_file": s.pid_file,
-                    "port": s.port,
-                    "health_url": s.health_url,
-                    "restart_command": s.restart_command,
-                    "restart_delay": s.restart_delay,
-                    "max_restarts": s.max_restarts,
-                    "check_interval": s.check_interval,
-                }
-                for s in self.services
-            ],
-            "notifiers": [{"type": n.type, "enabled": n.enabled} for n in self.notifiers],
-        }
+        result: dict[str, Any] = {name: getattr(self, name) for name in _GLOBAL_EXPORT_FIELDS}
+        result["services"] = [
+            {name: getattr(s, name) for name in _SVC_EXPORT_FIELDS} for s in self.services
+        ]
+        result["notifiers"] = [
+            {name: getattr(n, name) for name in _NOTIF_EXPORT_FIELDS} for n in self.notifiers
+        ]
+        return result
@@ -2,19 +2,54 @@
 
 from __future__ import annotations
 
+import asyncio
+import errno
+import os
+import selectors
 import socket
+import struct
 import subprocess
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 
 import psutil
-import requests
 
 from .config import ServiceConfig
 
+if TYPE_CHECKING:
+    import requests
 
-@dataclass
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _http_session() -> requests.Session:
+    """Return the shared keep-alive session used for health checks.
+
+    Reusing one pooled session avoids a fresh TCP (and TLS) handshake on
+    every health-url probe. requests is imported here rather than at
+    module load so services without health URLs never pay for it. The
+    double-checked lock keeps concurrent first-cycle probes from each
+    building (and leaking) their own session.
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                import requests
+
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=10)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _SESSION = session
+    return _SESSION
+
+
+@dataclass(slots=True)
 class ServiceStatus:
     """Status of a monitored service."""
 
@@ -33,97 +68,330 @@ class ServiceStatus:
         return self.running and self.error is None
 
 
+class _ProcessCache:
+    """Shared snapshot of running processes, refreshed at most once per TTL.
+
+    psutil.process_iter walks all of /proc on every call; when several
+    services use process_name detection that scan would otherwise repeat
+    once per service per tick. All monitors consult this single snapshot
+    instead.
+    """
+
+    def __init__(self, ttl: float = 5.0):
+        self.ttl = ttl
+        self._ts = 0.0
+        self._by_name: dict[str, dict] = {}
+
+    def refresh(self, force: bool = False):
+        """Rebuild the snapshot if it is older than the TTL."""
+        now = time.time()
+        if not force and now - self._ts < self.ttl:
+            return
+
+        by_name: dict[str, dict] = {}
+        for proc in psutil.process_iter(["name", "pid", "cpu_percent", "memory_info", "create_time"]):
+            try:
+                name = proc.info["name"]
+                if name and name not in by_name:
+                    by_name[name] = proc.info
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+
+        self._by_name = by_name
+        self._ts = now
+
+    def lookup(self, name: str) -> Optional[dict]:
+        """Return cached process info for a name, refreshing if stale."""
+        self.refresh()
+        return self._by_name.get(name)
+
+
+_PROC_CACHE = _ProcessCache()
+
+
+class _ListenCache:
+    """Cached map of listening TCP ports to owning PIDs.
+
+    psutil.net_connections walks the whole system connection table; one
+    pass per tick is enough for every port check to resolve its PID.
+    """
+
+    def __init__(self, ttl: float = 5.0):
+        self.ttl = ttl
+        self._ts = 0.0
+        self._map: dict[int, Optional[int]] = {}
+
+    def refresh(self, force: bool = False):
+        """Rebuild the port map if it is older than the TTL."""
+        now = time.time()
+        if not force and now - self._ts < self.ttl:
+            return
+
+        try:
+            conns = psutil.net_connections(kind="inet")
+        except psutil.AccessDenied:
+            # macOS and some Linux systems require root to enumerate connections
+            self._ts = now
+            return
+
+        self._map = {
+            conn.laddr.port: conn.pid
+            for conn in conns
+            if conn.status == "LISTEN" and conn.laddr
+        }
+        self._ts = now
+
+    def pid_for(self, port: int) -> Optional[int]:
+        """Return the PID listening on a port, refreshing if stale."""
+        self.refresh()
+        return self._map.get(port)
+
+
+_LISTEN_CACHE = _ListenCache()
+
+# Health-check responses keyed by URL as (checked_at, status_code);
+# monitors sharing an endpoint reuse one GET within the TTL
+_URL_CACHE: dict[str, tuple[float, int]] = {}
+_URL_CACHE_TTL = 5.0
+
+
 class ServiceMonitor:
     """Monitor individual services using various detection methods."""
 
     def __init__(self, config: ServiceConfig):
         self.config = config
+        # Resolve the configured detection methods once; check() then
+        # just walks this tuple instead of re-testing config every tick.
+        # Ordered cheapest first (file read, TCP connect, /proc lookup,
+        # HTTP roundtrip) so an inexpensive positive result short-circuits
+        # the expensive probes.
+        self._checks = tuple(
+            method
+            for configured, method in (
+                (config.pid_file, self._check_pid_file),
+                (config.port, self._check_port),
+                (config.process_name, self._check_process_name),
+                (config.health_url, self._check_health_url),
+            )
+            if configured
+        )
 
-    def check(self) -> ServiceStatus:
-        """Check if service is running using configured methods."""
+    def check(self, gather_metrics: bool = False) -> ServiceStatus:
+        """Check if service is running using configured methods.
+
+        The watchdog loop only needs the running/healthy verdict, so CPU
+        and memory figures are skipped unless gather_metrics is set (as
+        the status CLI does).
+        """
         status = ServiceStatus(name=self.config.name, running=False)
 
         # Try each detection method in order of preference
-        if self.config.health_url:
-            status = self._check_health_url(status)
+        for check in self._checks:
+            status = check(status, gather_metrics)
             if status.running:
                 return status
 
-        if self.config.port:
-            status = self._check_port(status)
+        return status
+
+    async def check_async(self, gather_metrics: bool = False) -> ServiceStatus:
+        """Asynchronous variant of check() for concurrent fan-out.
+
+        Port probes use asyncio.open_connection natively; the blocking
+        detection methods run in the default executor, so gathering the
+        coroutines of many monitors overlaps all their I/O waits and the
+        check phase takes the time of the slowest probe, not the sum.
+        """
+        loop = asyncio.get_running_loop()
+        status = ServiceStatus(name=self.config.name, running=False)
+
+        # Same cheapest-first ordering as the sync path
+        if self.config.pid_file:
+            status = self._check_pid_file(status, gather_metrics)
             if status.running:
                 return status
 
-        if self.config.pid_file:
-            status = self._check_pid_file(status)
+        if self.config.port:
+            status = await self._check_port_async(status)
             if status.running:
                 return status
 
         if self.config.process_name:
-            status = self._check_process_name(status)
+            status = await loop.run_in_executor(
+                None, self._check_process_name, status, gather_metrics
+            )
             if status.running:
                 return status
 
+        if self.config.health_url:
+            status = await loop.run_in_executor(None, self._check_health_url, status)
+
         return status
 
-    def _check_process_name(self, status: ServiceStatus) -> ServiceStatus:
-        """Check if process is running by name."""
-        status.check_method = "process_name"
+    async def _check_port_async(self, status: ServiceStatus) -> ServiceStatus:
+        """Non-blocking port probe on the running event loop."""
+        status.check_method = "port"
 
-        for proc in psutil.process_iter(["name", "pid", "cpu_percent", "memory_info", "create_time"]):
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection("127.0.0.1", self.config.port), timeout=5
+            )
+            status.running = True
+            writer.close()
             try:
-                if proc.info["name"] == self.config.process_name:
-                    status.running = True
-                    status.pid = proc.info["pid"]
-                    status.cpu_percent = proc.info["cpu_percent"]
-                    if proc.info["memory_info"]:
-                        status.memory_mb = proc.info["memory_info"].rss / (1024 * 1024)
-                    if proc.info["create_time"]:
-                        import time
-                        status.uptime_seconds = time.time() - proc.info["create_time"]
-                    return status
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                await writer.wait_closed()
+            except OSError:
+                pass
+        except asyncio.TimeoutError:
+            status.error = f"Port {self.config.port} connect timed out"
+        except OSError:
+            status.error = f"Port {self.config.port} not listening"
+
+        return status
+
+    @classmethod
+    def check_ports_batch(
+        cls, monitors: list["ServiceMonitor"], timeout: float = 5.0
+    ) -> dict[str, bool]:
+        """Probe the TCP ports of several monitors concurrently.
+
+        Issues non-blocking connects for every configured port and
+        multiplexes them through one selector, so total wall time is
+        bounded by the slowest probe instead of the sum of per-port
+        timeouts. Returns a mapping of service name to port-open.
+        """
+        sel = selectors.DefaultSelector()
+        results: dict[str, bool] = {}
+        pending = 0
+
+        for monitor in monitors:
+            port = monitor.config.port
+            if not port:
                 continue
+            name = monitor.config.name
+            results[name] = False
+
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setblocking(False)
+            err = sock.connect_ex(("127.0.0.1", port))
+            if err == 0:
+                # Loopback connects often complete immediately
+                results[name] = True
+                sock.close()
+            elif err in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                sel.register(sock, selectors.EVENT_WRITE, name)
+                pending += 1
+            else:
+                sock.close()
+
+        deadline = time.monotonic() + timeout
+        try:
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in sel.select(remaining):
+                    sock = key.fileobj
+                    sel.unregister(sock)
+                    pending -= 1
+                    results[key.data] = (
+                        sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+                    )
+                    sock.close()
+        finally:
+            for key in list(sel.get_map().values()):
+                key.fileobj.close()
+            sel.close()
+
+        return results
+
+    def _check_process_name(
+        self, status: ServiceStatus, gather_metrics: bool = False
+    ) -> ServiceStatus:
+        """Check if process is running by name."""
+        status.check_method = "process_name"
+
+        info = _PROC_CACHE.lookup(self.config.process_name)
+        if info is None:
+            return status
+
+        status.running = True
+        status.pid = info["pid"]
+        if gather_metrics:
+            status.cpu_percent = info["cpu_percent"]
+            if info["memory_info"]:
+                status.memory_mb = info["memory_info"].rss / (1024 * 1024)
+            if info["create_time"]:
+                status.uptime_seconds = time.time() - info["create_time"]
 
         return status
 
-    def _check_pid_file(self, status: ServiceStatus) -> ServiceStatus:
+    def _check_pid_file(
+        self, status: ServiceStatus, gather_metrics: bool = False
+    ) -> ServiceStatus:
         """Check if process is running using PID file."""
         status.check_method = "pid_file"
-        pid_path = Path(self.config.pid_file)
 
-        if not pid_path.exists():
-            status.error = f"PID file not found: {pid_path}"
+        # Raw os.open/os.read avoids the text-layer and stat overhead of
+        # Path.read_text for a file that is only ever a few bytes.
+        try:
+            fd = os.open(self.config.pid_file, os.O_RDONLY)
+            try:
+                buf = os.read(fd, 32)
+            finally:
+                os.close(fd)
+            pid = int(buf)
+        except FileNotFoundError:
+            status.error = f"PID file not found: {self.config.pid_file}"
+            return status
+        except (ValueError, OSError):
+            status.error = f"Invalid PID file: {self.config.pid_file}"
             return status
 
         try:
-            pid = int(pid_path.read_text().strip())
             if psutil.pid_exists(pid):
-                proc = psutil.Process(pid)
                 status.running = True
                 status.pid = pid
-                status.cpu_percent = proc.cpu_percent()
-                status.memory_mb = proc.memory_info().rss / (1024 * 1024)
-                status.uptime_seconds = proc.create_time()
+                if gather_metrics:
+                    proc = psutil.Process(pid)
+                    status.cpu_percent = proc.cpu_percent()
+                    status.memory_mb = proc.memory_info().rss / (1024 * 1024)
+                    status.uptime_seconds = proc.create_time()
             else:
                 status.error = f"PID {pid} not running (stale PID file)"
-        except ValueError:
-            status.error = f"Invalid PID file: {pid_path}"
         except psutil.NoSuchProcess:
             status.error = f"Process {pid} not found"
 
         return status
 
-    def _check_port(self, status: ServiceStatus) -> ServiceStatus:
+    def _check_port(
+        self, status: ServiceStatus, gather_metrics: bool = False
+    ) -> ServiceStatus:
         """Check if service is listening on configured port."""
         status.check_method = "port"
 
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(5)
+        # Non-blocking connect, waited on with a selector (the same
+        # approach check_ports_batch uses) so the probing thread never
+        # blocks inside connect itself.
+        sock.setblocking(False)
+        # Abort the connect after 2s at the kernel level (Linux) so a
+        # black-holed port doesn't hold us for the full timeout, and
+        # close with RST instead of a graceful FIN to skip TIME_WAIT.
+        if hasattr(socket, "TCP_USER_TIMEOUT"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, 2000)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
 
         try:
             result = sock.connect_ex(("127.0.0.1", self.config.port))
-            status.running = result == 0
+            if result == 0:
+                status.running = True
+            elif result == errno.EINPROGRESS:
+                sel = selectors.DefaultSelector()
+                sel.register(sock, selectors.EVENT_WRITE)
+                ready = sel.select(timeout=5)
+                sel.close()
+                if ready:
+                    status.running = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
             if not status.running:
                 status.error = f"Port {self.config.port} not listening"
         except socket.error as e:
@@ -132,36 +400,52 @@ class ServiceMonitor:
             sock.close()
 
         # Try to find the process using this port (may require elevated permissions)
-        if status.running:
-            try:
-                for conn in psutil.net_connections(kind="inet"):
-                    if conn.laddr.port == self.config.port and conn.status == "LISTEN":
-                        try:
-                            proc = psutil.Process(conn.pid)
-                            status.pid = conn.pid
-                            status.cpu_percent = proc.cpu_percent()
-                            status.memory_mb = proc.memory_info().rss / (1024 * 1024)
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            pass
-                        break
-            except psutil.AccessDenied:
-                # macOS and some Linux systems require root to enumerate connections
-                pass
+        if status.running and gather_metrics:
+            pid = _LISTEN_CACHE.pid_for(self.config.port)
+            if pid:
+                try:
+                    proc = psutil.Process(pid)
+                    status.pid = pid
+                    status.cpu_percent = proc.cpu_percent()
+                    status.memory_mb = proc.memory_info().rss / (1024 * 1024)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
 
         return status
 
-    def _check_health_url(self, status: ServiceStatus) -> ServiceStatus:
-        """Check service health via HTTP endpoint."""
+    def _check_health_url(
+        self, status: ServiceStatus, gather_metrics: bool = False
+    ) -> ServiceStatus:
+        """Check service health via HTTP endpoint.
+
+        Responses are cached per URL for a few seconds so services
+        sharing a health endpoint (reverse-proxied deployments) coalesce
+        into one outbound GET per cycle.
+        """
+        import requests
+
         status.check_method = "health_url"
 
+        cached = _URL_CACHE.get(self.config.health_url)
+        if cached is not None and time.monotonic() - cached[0] < _URL_CACHE_TTL:
+            status_code = cached[1]
+            status.running = status_code < 500
+            if not status.running:
+                status.error = f"Health check returned {status_code}"
+            return status
+
         try:
-            response = requests.get(
+            response = _http_session().get(
                 self.config.health_url,
                 timeout=self.config.health_timeout,
+                stream=False,
             )
+            _URL_CACHE[self.config.health_url] = (time.monotonic(), response.status_code)
             status.running = response.status_code < 500
             if not status.running:
                 status.error = f"Health check returned {response.status_code}"
+            # Release the connection back to the pool
+            response.close()
         except requests.Timeout:
             status.error = f"Health check timed out after {self.config.health_timeout}s"
         except requests.RequestException as e:
@@ -176,14 +460,19 @@ class ServiceController:
     def __init__(self, config: ServiceConfig, dry_run: bool = False):
         self.config = config
         self.dry_run = dry_run
+        # Merge the service env with the process env once; None means
+        # the subprocess simply inherits our environment.
+        self._env = {**os.environ, **config.env} if config.env else None
 
     def start(self) -> tuple[bool, str]:
         """Start the service."""
-        cmd = self.config.start_command or self.config.restart_command
-        if not cmd:
-            return False, "No start command configured"
-
-        return self._run_command(cmd, "start")
+        if self.config.start_command:
+            return self._run_command(self.config.start_command, "start", self.config._start_argv)
+        if self.config.restart_command:
+            return self._run_command(
+                self.config.restart_command, "start", self.config._restart_argv
+            )
+        return False, "No start command configured"
 
     def stop(self) -> tuple[bool, str]:
         """Stop the service."""
@@ -191,13 +480,13 @@ class ServiceController:
         if not cmd:
             return False, "No stop command configured"
 
-        return self._run_command(cmd, "stop")
+        return self._run_command(cmd, "stop", self.config._stop_argv)
 
     def restart(self) -> tuple[bool, str]:
         """Restart the service."""
         cmd = self.config.restart_command
         if cmd:
-            return self._run_command(cmd, "restart")
+            return self._run_command(cmd, "restart", self.config._restart_argv)
 
         # Fallback to stop + start
         if self.config.stop_command:
@@ -207,22 +496,26 @@ class ServiceController:
 
         return self.start()
 
-    def _run_command(self, cmd: str, action: str) -> tuple[bool, str]:
-        """Execute a command."""
+    def _run_command(
+        self, cmd: str, action: str, argv: Optional[list[str]] = None
+    ) -> tuple[bool, str]:
+        """Execute a command, preferring the pre-split argv when available.
+
+        Commands with no shell metacharacters were split at config load
+        and exec directly, skipping the /bin/sh fork; anything else
+        still goes through the shell.
+        """
         if self.dry_run:
             return True, f"[DRY-RUN] Would execute: {cmd}"
 
         try:
-            env = dict(subprocess.os.environ)
-            env.update(self.config.env)
-
             result = subprocess.run(
-                cmd,
-                shell=True,
+                argv if argv is not None else cmd,
+                shell=argv is None,
                 capture_output=True,
                 text=True,
                 cwd=self.config.working_dir,
-                env=env,
+                env=self._env,
                 timeout=60,
             )
 
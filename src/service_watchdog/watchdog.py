@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import hashlib
+import heapq
 import json
 import logging
+import logging.handlers
 import os
+import selectors
 import signal
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -15,12 +21,24 @@ from typing import Optional
 
 from .config import ServiceConfig, WatchdogConfig
 from .monitor import ServiceController, ServiceMonitor, ServiceStatus
-from .notifiers import BaseNotifier, NotificationEvent, NotifierFactory
+from .notifiers import BaseNotifier, NotificationEvent, NotifierFactory, close_http_session
 
 logger = logging.getLogger("service-watchdog")
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+def _dump_state(data: dict) -> bytes:
+    """Encode state compactly, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+@dataclass(slots=True)
 class ServiceState:
     """Runtime state for a monitored service."""
 
@@ -34,7 +52,7 @@ class ServiceState:
     alerted: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class WatchdogState:
     """Persistent state for the watchdog daemon."""
 
@@ -42,7 +60,13 @@ class WatchdogState:
     started_at: float = field(default_factory=time.time)
 
     def to_dict(self) -> dict:
-        """Serialize state to dictionary."""
+        """Serialize state to dictionary.
+
+        last_check is deliberately not persisted: it changes on every
+        cycle, and writing it would defeat the unchanged-payload skip in
+        _save_state. After a restart every service is simply due
+        immediately, which is the behaviour we want anyway.
+        """
         return {
             "started_at": self.started_at,
             "services": {
@@ -50,7 +74,6 @@ class WatchdogState:
                     "consecutive_failures": svc.consecutive_failures,
                     "restart_count": svc.restart_count,
                     "restart_window_start": svc.restart_window_start,
-                    "last_check": svc.last_check,
                     "pending_restart_at": svc.pending_restart_at,
                     "alerted": svc.alerted,
                 }
@@ -83,6 +106,46 @@ class ServiceWatchdog:
         self.state = WatchdogState()
         self.notifiers: list[BaseNotifier] = []
         self.running = False
+        # Notifications fan out on this pool so one slow channel doesn't
+        # serialize the others (or stall the check loop)
+        self._notify_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="notify")
+        # Probes fan out here too, so a cycle's latency is the slowest
+        # check rather than the sum of all of them
+        self._probe_pool = ThreadPoolExecutor(
+            max_workers=min(32, max(1, len(config.services))), thread_name_prefix="probe"
+        )
+        # Content hash -> last-sent timestamp, for duplicate suppression
+        self._dedupe: dict[bytes, float] = {}
+        # Events queued during the current cycle, flushed as one batch
+        self._pending_events: list[NotificationEvent] = []
+        # Skip state writes on cycles where nothing changed
+        self._state_dirty = True
+        self._state_digest: Optional[bytes] = None
+        # Cache the state/PID paths and create their directories once;
+        # _save_state runs every cycle and shouldn't re-stat the parent
+        self._state_path = Path(config.state_file)
+        self._pid_path = Path(config.pid_file)
+        if not config.dry_run:
+            for path in (self._state_path, self._pid_path):
+                try:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                except OSError:
+                    pass  # surfaced when the write itself fails
+        # Scheduler heap of (monotonic due time, service name); the
+        # daemon loop sleeps until the earliest entry instead of
+        # scanning every service every second
+        self._heap: list[tuple[float, str]] = []
+
+        # Disabled services never take part in a cycle; filter once
+        # instead of branching on every tick
+        self._enabled_services = [svc for svc in config.services if svc.enabled]
+
+        # One monitor per service, built once: ServiceMonitor resolves
+        # its detection methods in __init__, so constructing it per
+        # check would redo that branching every tick
+        self._monitors: dict[str, ServiceMonitor] = {
+            svc.name: ServiceMonitor(svc) for svc in config.services
+        }
 
         # Initialize state for each service
         for svc in config.services:
@@ -94,7 +157,7 @@ class ServiceWatchdog:
                 notifier = NotifierFactory.create(notif_config)
                 self.notifiers.append(notifier)
             except ValueError as e:
-                logger.warning(f"Failed to create notifier: {e}")
+                logger.warning("Failed to create notifier: %s", e)
 
         self._setup_logging()
 
@@ -111,90 +174,165 @@ class ServiceWatchdog:
         )
         logger.addHandler(console)
 
-        # File handler
+        # File handler, buffered so routine INFO/DEBUG lines batch into
+        # one write instead of a syscall per record; WARNING and above
+        # (and shutdown) flush immediately
+        self._log_buffer: Optional[logging.handlers.MemoryHandler] = None
         if self.config.log_file and not self.config.dry_run:
             try:
                 log_path = Path(self.config.log_file)
                 log_path.parent.mkdir(parents=True, exist_ok=True)
                 file_handler = logging.FileHandler(log_path)
-                file_handler.setLevel(level)
                 file_handler.setFormatter(
                     logging.Formatter(
                         "%(asctime)s [%(levelname)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
                     )
                 )
-                logger.addHandler(file_handler)
+                buffered = logging.handlers.MemoryHandler(
+                    capacity=1024,
+                    flushLevel=logging.WARNING,
+                    target=file_handler,
+                    flushOnClose=True,
+                )
+                buffered.setLevel(level)
+                logger.addHandler(buffered)
+                self._log_buffer = buffered
             except PermissionError:
-                logger.warning(f"Cannot write to log file: {self.config.log_file}")
+                logger.warning("Cannot write to log file: %s", self.config.log_file)
 
     def _load_state(self):
         """Load persistent state from file."""
-        state_path = Path(self.config.state_file)
-        if state_path.exists():
+        if self._state_path.exists():
             try:
-                with open(state_path) as f:
+                with open(self._state_path) as f:
                     data = json.load(f)
                     self.state = WatchdogState.from_dict(data)
-                    logger.info(f"Loaded state from {state_path}")
+                    logger.info("Loaded state from %s", self._state_path)
             except Exception as e:
-                logger.warning(f"Failed to load state: {e}")
+                logger.warning("Failed to load state: %s", e)
 
     def _save_state(self):
-        """Save persistent state to file."""
-        if self.config.dry_run:
+        """Save persistent state to file, atomically and only when changed.
+
+        Writing to a temp file and renaming means a crash mid-write
+        never leaves a truncated state file behind.
+        """
+        if self.config.dry_run or not self._state_dirty:
             return
 
-        state_path = Path(self.config.state_file)
         try:
-            state_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(state_path, "w") as f:
-                json.dump(self.state.to_dict(), f, indent=2)
+            payload = _dump_state(self.state.to_dict())
+            # Dirty-flagged mutations don't always change what gets
+            # persisted (last_check and last_status aren't serialized);
+            # hash the payload and skip the disk write when the bytes
+            # are identical, which is every steady-state cycle
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            if digest == self._state_digest:
+                self._state_dirty = False
+                return
+            tmp_path = self._state_path.with_suffix(".tmp")
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, self._state_path)
+            self._state_digest = digest
+            self._state_dirty = False
         except Exception as e:
-            logger.warning(f"Failed to save state: {e}")
+            logger.warning("Failed to save state: %s", e)
 
     def _write_pid_file(self):
         """Write PID file for daemon mode."""
         if self.config.dry_run:
             return
 
-        pid_path = Path(self.config.pid_file)
         try:
-            pid_path.parent.mkdir(parents=True, exist_ok=True)
-            pid_path.write_text(str(os.getpid()))
-            logger.debug(f"Wrote PID file: {pid_path}")
+            self._pid_path.write_text(str(os.getpid()))
+            logger.debug("Wrote PID file: %s", self._pid_path)
         except Exception as e:
-            logger.warning(f"Failed to write PID file: {e}")
+            logger.warning("Failed to write PID file: %s", e)
 
     def _remove_pid_file(self):
         """Remove PID file on shutdown."""
-        pid_path = Path(self.config.pid_file)
         try:
-            if pid_path.exists():
-                pid_path.unlink()
+            if self._pid_path.exists():
+                self._pid_path.unlink()
         except Exception:
             pass
 
     def notify(self, event: NotificationEvent):
-        """Send notification to all configured notifiers."""
-        for notifier in self.notifiers:
-            try:
-                success, message = notifier.send(event)
-                if success:
-                    logger.debug(f"Notification sent via {notifier.config.type}: {message}")
-                else:
-                    logger.warning(f"Notification failed via {notifier.config.type}: {message}")
-            except Exception as e:
-                logger.error(f"Notification error ({notifier.config.type}): {e}")
+        """Queue a notification for delivery at the end of the cycle.
+
+        Events produced within one cycle are flushed together so a
+        fleet-wide outage costs each notifier one batched request
+        instead of one per service.
+        """
+        if not self.notifiers:
+            return
+
+        # Suppress content-identical events within the dedupe window so
+        # flapping services (or a shared failing dependency) don't burn
+        # an HTTP/SMTP round trip per repeat.
+        now = time.time()
+        key = hashlib.blake2b(
+            f"{event.event_type}|{event.service_name}|{event.message}".encode(),
+            digest_size=16,
+        ).digest()
+        last_sent = self._dedupe.get(key)
+        if last_sent is not None and now - last_sent < self.config.dedupe_window:
+            logger.debug("Suppressed duplicate notification for '%s'", event.service_name)
+            return
+        self._dedupe[key] = now
+
+        self._pending_events.append(event)
 
-    def check_service(self, svc_config: ServiceConfig) -> ServiceStatus:
+    def _flush_notifications(self):
+        """Deliver all queued events, one concurrent batch per notifier.
+
+        Each send_batch blocks on network I/O for up to ~30s;
+        dispatching them on the pool makes total latency the slowest
+        channel instead of the sum of all of them.
+        """
+        if not self._pending_events:
+            return
+
+        events = self._pending_events
+        self._pending_events = []
+
+        # Disabled notifiers are skipped here rather than inside their
+        # worker, so they never cost a pool slot or payload build
+        futures = {
+            self._notify_pool.submit(n.send_batch, events): n
+            for n in self.notifiers
+            if n.config.enabled
+        }
+        try:
+            for future in as_completed(futures, timeout=35):
+                notifier = futures[future]
+                try:
+                    success, message = future.result()
+                    if success:
+                        logger.debug("Notification sent via %s: %s", notifier.config.type, message)
+                    else:
+                        logger.warning(
+                            "Notification failed via %s: %s", notifier.config.type, message
+                        )
+                except Exception as e:
+                    logger.error("Notification error (%s): %s", notifier.config.type, e)
+        except FuturesTimeoutError:
+            logger.warning("Timed out waiting for notification delivery")
+
+    def check_service(
+        self, svc_config: ServiceConfig, gather_metrics: bool = False
+    ) -> ServiceStatus:
         """Check a single service and return its status."""
-        monitor = ServiceMonitor(svc_config)
-        status = monitor.check()
+        monitor = self._monitors.get(svc_config.name)
+        if monitor is None:
+            monitor = self._monitors[svc_config.name] = ServiceMonitor(svc_config)
+        status = monitor.check(gather_metrics=gather_metrics)
 
         state = self.state.services.get(svc_config.name)
         if state:
             state.last_check = time.time()
             state.last_status = status
+            self._state_dirty = True
 
         return status
 
@@ -202,10 +340,13 @@ class ServiceWatchdog:
         """Handle service failure detection."""
         state = self.state.services[svc_config.name]
         state.consecutive_failures += 1
+        self._state_dirty = True
 
         logger.warning(
-            f"Service '{svc_config.name}' failure #{state.consecutive_failures} "
-            f"(threshold: {svc_config.failure_threshold})"
+            "Service '%s' failure #%d (threshold: %d)",
+            svc_config.name,
+            state.consecutive_failures,
+            svc_config.failure_threshold,
         )
 
         # Check if we've hit the failure threshold
@@ -226,7 +367,7 @@ class ServiceWatchdog:
             if state.pending_restart_at is None:
                 state.pending_restart_at = time.time() + svc_config.restart_delay
                 logger.info(
-                    f"Scheduled restart of '{svc_config.name}' in {svc_config.restart_delay}s"
+                    "Scheduled restart of '%s' in %ds", svc_config.name, svc_config.restart_delay
                 )
 
     def handle_recovery(self, svc_config: ServiceConfig, status: ServiceStatus):
@@ -234,7 +375,7 @@ class ServiceWatchdog:
         state = self.state.services[svc_config.name]
 
         if state.consecutive_failures > 0 or state.alerted:
-            logger.info(f"Service '{svc_config.name}' recovered")
+            logger.info("Service '%s' recovered", svc_config.name)
 
             # Send recovery notification
             event = NotificationEvent(
@@ -246,14 +387,26 @@ class ServiceWatchdog:
             self.notify(event)
 
         # Reset state
+        if state.consecutive_failures or state.alerted or state.pending_restart_at:
+            self._state_dirty = True
         state.consecutive_failures = 0
         state.alerted = False
         state.pending_restart_at = None
 
     def attempt_restart(self, svc_config: ServiceConfig):
         """Attempt to restart a failed service."""
+        if not self._begin_restart(svc_config):
+            return
+
+        controller = ServiceController(svc_config, dry_run=self.config.dry_run)
+        success, message = controller.restart()
+        self._finish_restart(svc_config, success, message)
+
+    def _begin_restart(self, svc_config: ServiceConfig) -> bool:
+        """Restart-window bookkeeping; False when the budget is exhausted."""
         state = self.state.services[svc_config.name]
         now = time.time()
+        self._state_dirty = True
 
         # Check restart window
         if state.restart_window_start is None:
@@ -267,8 +420,9 @@ class ServiceWatchdog:
         # Check max restarts
         if state.restart_count >= svc_config.max_restarts:
             logger.error(
-                f"Service '{svc_config.name}' exceeded max restarts "
-                f"({svc_config.max_restarts}) within window"
+                "Service '%s' exceeded max restarts (%d) within window",
+                svc_config.name,
+                svc_config.max_restarts,
             )
             event = NotificationEvent(
                 event_type=NotificationEvent.RESTART_FAILED,
@@ -278,16 +432,18 @@ class ServiceWatchdog:
             )
             self.notify(event)
             state.pending_restart_at = None  # Stop trying
-            return
+            return False
 
-        # Attempt restart
-        controller = ServiceController(svc_config, dry_run=self.config.dry_run)
-        success, message = controller.restart()
+        return True
+
+    def _finish_restart(self, svc_config: ServiceConfig, success: bool, message: str):
+        """Record the outcome of a restart and notify."""
+        state = self.state.services[svc_config.name]
         state.restart_count += 1
         state.pending_restart_at = None
 
         if success:
-            logger.info(f"Service '{svc_config.name}' restarted: {message}")
+            logger.info("Service '%s' restarted: %s", svc_config.name, message)
             event = NotificationEvent(
                 event_type=NotificationEvent.RESTART,
                 service_name=svc_config.name,
@@ -295,7 +451,7 @@ class ServiceWatchdog:
                 f"Restart #{state.restart_count} within current window.",
             )
         else:
-            logger.error(f"Failed to restart '{svc_config.name}': {message}")
+            logger.error("Failed to restart '%s': %s", svc_config.name, message)
             event = NotificationEvent(
                 event_type=NotificationEvent.RESTART_FAILED,
                 service_name=svc_config.name,
@@ -307,36 +463,157 @@ class ServiceWatchdog:
 
         self.notify(event)
 
+    def _purge_dedupe(self):
+        """Drop expired dedupe entries so the map doesn't grow unbounded."""
+        if self._dedupe:
+            now = time.time()
+            window = self.config.dedupe_window
+            self._dedupe = {k: v for k, v in self._dedupe.items() if now - v < window}
+
+    def _restart_many(self, restarts: list[ServiceConfig]):
+        """Run due restarts concurrently on the probe pool.
+
+        Window bookkeeping and outcome handling stay on the calling
+        thread; only the subprocess-bound controller.restart calls
+        overlap, so N failing services restart in max rather than sum
+        of their command times.
+        """
+        ready = [svc for svc in restarts if self._begin_restart(svc)]
+        if not ready:
+            return
+
+        if len(ready) == 1:
+            svc_config = ready[0]
+            controller = ServiceController(svc_config, dry_run=self.config.dry_run)
+            self._finish_restart(svc_config, *controller.restart())
+            return
+
+        futures = {
+            self._probe_pool.submit(
+                ServiceController(svc, dry_run=self.config.dry_run).restart
+            ): svc
+            for svc in ready
+        }
+        for future in as_completed(futures):
+            svc_config = futures[future]
+            try:
+                success, message = future.result()
+            except Exception as e:
+                success, message = False, f"Restart raised: {e}"
+            self._finish_restart(svc_config, success, message)
+
+    def _check_many(
+        self, due: list[ServiceConfig]
+    ) -> list[tuple[ServiceConfig, ServiceStatus]]:
+        """Probe several services concurrently, preserving input order.
+
+        Only the probes run on the pool; callers apply failure/recovery
+        handling on their own thread so state mutation stays
+        single-threaded.
+        """
+        if len(due) == 1:
+            return [(due[0], self.check_service(due[0]))]
+        return list(zip(due, self._probe_pool.map(self.check_service, due)))
+
     def run_once(self):
         """Run a single check cycle for all services."""
-        for svc_config in self.config.services:
-            if not svc_config.enabled:
-                continue
+        self._purge_dedupe()
 
+        now = time.time()
+        due: list[ServiceConfig] = []
+        restarts: list[ServiceConfig] = []
+        for svc_config in self._enabled_services:
             state = self.state.services.get(svc_config.name)
             if not state:
                 state = ServiceState(name=svc_config.name)
                 self.state.services[svc_config.name] = state
 
             # Check if pending restart is due
-            if state.pending_restart_at and time.time() >= state.pending_restart_at:
-                self.attempt_restart(svc_config)
+            if state.pending_restart_at and now >= state.pending_restart_at:
+                restarts.append(svc_config)
                 continue
 
             # Check if it's time for a check
-            if state.last_check:
-                elapsed = time.time() - state.last_check
-                if elapsed < svc_config.check_interval:
-                    continue
+            if state.last_check and now - state.last_check < svc_config.check_interval:
+                continue
+
+            due.append(svc_config)
 
-            # Perform the check
-            status = self.check_service(svc_config)
+        self._restart_many(restarts)
 
+        for svc_config, status in self._check_many(due):
             if status.healthy:
                 self.handle_recovery(svc_config, status)
             else:
                 self.handle_failure(svc_config, status)
 
+        self._flush_notifications()
+        self._save_state()
+
+    def _schedule_all(self):
+        """Seed the scheduler heap with every enabled service, due now."""
+        now = time.monotonic()
+        self._heap = [(now, svc.name) for svc in self._enabled_services]
+        heapq.heapify(self._heap)
+
+    def _next_delay(self, svc_config: ServiceConfig) -> float:
+        """Seconds until the service next needs attention.
+
+        A pending restart (possibly just scheduled) may come due before
+        the next regular check.
+        """
+        state = self.state.services[svc_config.name]
+        if state.pending_restart_at:
+            return max(min(svc_config.check_interval, state.pending_restart_at - time.time()), 0.0)
+        return float(svc_config.check_interval)
+
+    def _run_due(self):
+        """Process every due service and push it back with its next deadline."""
+        self._purge_dedupe()
+
+        services_by_name = {svc.name: svc for svc in self.config.services}
+        now = time.monotonic()
+        due: list[ServiceConfig] = []
+        restarts: list[ServiceConfig] = []
+        while self._heap and self._heap[0][0] <= now:
+            _, name = heapq.heappop(self._heap)
+            svc_config = services_by_name.get(name)
+            if svc_config is None or not svc_config.enabled:
+                continue
+
+            state = self.state.services.get(svc_config.name)
+            if not state:
+                state = ServiceState(name=svc_config.name)
+                self.state.services[svc_config.name] = state
+
+            if state.pending_restart_at:
+                if time.time() >= state.pending_restart_at:
+                    restarts.append(svc_config)
+                else:
+                    heapq.heappush(
+                        self._heap, (time.monotonic() + self._next_delay(svc_config), name)
+                    )
+            else:
+                due.append(svc_config)
+
+        self._restart_many(restarts)
+        for svc_config in restarts:
+            heapq.heappush(
+                self._heap,
+                (time.monotonic() + self._next_delay(svc_config), svc_config.name),
+            )
+
+        for svc_config, status in self._check_many(due):
+            if status.healthy:
+                self.handle_recovery(svc_config, status)
+            else:
+                self.handle_failure(svc_config, status)
+            heapq.heappush(
+                self._heap,
+                (time.monotonic() + self._next_delay(svc_config), svc_config.name),
+            )
+
+        self._flush_notifications()
         self._save_state()
 
     def run(self):
@@ -347,25 +624,68 @@ class ServiceWatchdog:
 
         # Setup signal handlers
         def handle_signal(signum, frame):
-            logger.info(f"Received signal {signum}, shutting down...")
+            logger.info("Received signal %d, shutting down...", signum)
             self.running = False
 
         signal.signal(signal.SIGTERM, handle_signal)
         signal.signal(signal.SIGINT, handle_signal)
 
+        # Self-pipe wakeup: signals write a byte here, so the selector
+        # sleep below returns immediately instead of letting SIGTERM
+        # wait out the remainder of the interval.
+        wake_r, wake_w = os.pipe()
+        os.set_blocking(wake_r, False)
+        os.set_blocking(wake_w, False)
+        old_wakeup_fd = signal.set_wakeup_fd(wake_w)
+
+        sel = selectors.DefaultSelector()
+        sel.register(wake_r, selectors.EVENT_READ)
+
         logger.info("Service Watchdog started")
         if self.config.dry_run:
             logger.info("Running in DRY-RUN mode")
 
-        logger.info(f"Monitoring {len(self.config.services)} services")
+        logger.info("Monitoring %d services", len(self.config.services))
+
+        self._schedule_all()
 
         try:
             while self.running:
-                self.run_once()
-                time.sleep(1)  # Main loop runs every second
+                self._run_due()
+                # Sleep until the earliest heap deadline; a signal writes
+                # to the wakeup pipe and cuts the sleep short
+                if self._heap:
+                    timeout = max(self._heap[0][0] - time.monotonic(), 0.0)
+                else:
+                    timeout = 1.0
+                if sel.select(timeout=timeout):
+                    self._drain_wakeup(wake_r)
         finally:
+            signal.set_wakeup_fd(old_wakeup_fd)
+            sel.close()
+            os.close(wake_r)
+            os.close(wake_w)
+            self._probe_pool.shutdown(wait=False)
+            self._notify_pool.shutdown(wait=False)
+            for notifier in self.notifiers:
+                try:
+                    notifier.close()
+                except Exception as e:
+                    logger.debug("Error closing notifier: %s", e)
+            close_http_session()
             self._remove_pid_file()
             logger.info("Service Watchdog stopped")
+            if self._log_buffer is not None:
+                self._log_buffer.flush()
+
+    @staticmethod
+    def _drain_wakeup(fd: int):
+        """Consume pending bytes from the signal wakeup pipe."""
+        try:
+            while os.read(fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
 
     def status(self) -> dict:
         """Get current status of all monitored services."""
@@ -380,7 +700,7 @@ class ServiceWatchdog:
 
         for svc_config in self.config.services:
             state = self.state.services.get(svc_config.name)
-            status = self.check_service(svc_config)
+            status = self.check_service(svc_config, gather_metrics=True)
 
             result["services"][svc_config.name] = {
                 "enabled": svc_config.enabled,
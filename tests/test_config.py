@@ -1,7 +1,6 @@
 """Tests for configuration handling."""
 
-import tempfile
-from pathlib import Path
+import io
 
 import pytest
 
@@ -18,7 +17,7 @@ class TestServiceConfig:
             process_name="nginx",
             restart_command="systemctl restart nginx",
         )
-        errors = config.validate()
+        errors = list(config.validate())
         assert errors == []
 
     def test_valid_config_with_port(self):
@@ -28,7 +27,7 @@ class TestServiceConfig:
             port=8080,
             restart_command="systemctl restart app",
         )
-        errors = config.validate()
+        errors = list(config.validate())
         assert errors == []
 
     def test_valid_config_with_health_url(self):
@@ -38,7 +37,7 @@ class TestServiceConfig:
             health_url="http://localhost/health",
             start_command="./start.sh",
         )
-        errors = config.validate()
+        errors = list(config.validate())
         assert errors == []
 
     def test_invalid_config_no_detection(self):
@@ -47,7 +46,7 @@ class TestServiceConfig:
             name="test-service",
             restart_command="systemctl restart app",
         )
-        errors = config.validate()
+        errors = list(config.validate())
         assert len(errors) == 1
         assert "detection method" in errors[0].lower()
 
@@ -57,7 +56,7 @@ class TestServiceConfig:
             name="test-service",
             port=8080,
         )
-        errors = config.validate()
+        errors = list(config.validate())
         assert len(errors) == 1
         assert "restart_command" in errors[0] or "start_command" in errors[0]
 
@@ -66,7 +65,7 @@ class TestWatchdogConfig:
     """Test WatchdogConfig loading and validation."""
 
     def test_load_from_yaml(self):
-        """Load config from YAML file."""
+        """Load config from an in-memory YAML stream."""
         yaml_content = """
 log_level: DEBUG
 services:
@@ -78,20 +77,25 @@ notifiers:
     bot_token: "123:ABC"
     chat_id: "12345"
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
+        config = WatchdogConfig.from_stream(io.StringIO(yaml_content))
+
+        assert config.log_level == "DEBUG"
+        assert len(config.services) == 1
+        assert config.services[0].name == "test-app"
+        assert config.services[0].port == 3000
+        assert len(config.notifiers) == 1
+        assert config.notifiers[0].type == "telegram"
 
-            config = WatchdogConfig.from_yaml(f.name)
+    def test_uses_libyaml_loader_when_available(self):
+        """Parse with the libyaml C loader when PyYAML was built with it."""
+        import yaml
 
-            assert config.log_level == "DEBUG"
-            assert len(config.services) == 1
-            assert config.services[0].name == "test-app"
-            assert config.services[0].port == 3000
-            assert len(config.notifiers) == 1
-            assert config.notifiers[0].type == "telegram"
+        from service_watchdog.config import _YamlLoader
 
-            Path(f.name).unlink()
+        if getattr(yaml, "__with_libyaml__", False):
+            assert _YamlLoader is yaml.CSafeLoader
+        else:
+            assert _YamlLoader is yaml.SafeLoader
 
     def test_validate_empty_services(self):
         """Validate error when no services configured."""
@@ -114,6 +118,25 @@ notifiers:
         errors = config.validate()
         assert errors == []
 
+    def test_env_assignment_command_needs_shell(self):
+        """A leading VAR=value assignment keeps the shell execution path."""
+        from service_watchdog.config import _split_command
+
+        assert _split_command("PORT=8080 ./run.sh") is None
+        assert _split_command("systemctl restart app") == ["systemctl", "restart", "app"]
+
+    def test_validate_detects_duplicates(self):
+        """Flag services that share the same detection target."""
+        config = WatchdogConfig(
+            services=[
+                ServiceConfig(name="web", port=8080, restart_command="restart.sh"),
+                ServiceConfig(name="web-copy", port=8080, restart_command="restart.sh"),
+            ]
+        )
+        errors = config.validate()
+        assert any("duplicate detection target" in e for e in errors)
+        assert any("web-copy" in e for e in errors)
+
     def test_to_dict(self):
         """Export config to dictionary."""
         config = WatchdogConfig(
@@ -155,6 +178,33 @@ class TestConfigFromDict:
         assert config.services[0].check_interval == 30
         assert config.services[0].failure_threshold == 2
 
+    def test_env_var_interpolation(self, monkeypatch):
+        """${VAR} references are resolved at load time."""
+        monkeypatch.setenv("TEST_BOT_TOKEN", "123:ABC")
+        monkeypatch.delenv("TEST_MISSING_VAR", raising=False)
+
+        data = {
+            "services": [
+                {
+                    "name": "app",
+                    "port": 3000,
+                    "restart_command": "restart.sh",
+                }
+            ],
+            "notifiers": [
+                {
+                    "type": "telegram",
+                    "bot_token": "${TEST_BOT_TOKEN}",
+                    "chat_id": "${TEST_MISSING_VAR}",
+                }
+            ],
+        }
+        config = WatchdogConfig.from_dict(data)
+
+        assert config.notifiers[0].bot_token == "123:ABC"
+        # Unknown variables are left untouched
+        assert config.notifiers[0].chat_id == "${TEST_MISSING_VAR}"
+
     def test_full_config(self):
         """Create config with all options."""
         data = {
@@ -1,5 +1,6 @@
 """Tests for service monitoring."""
 
+import asyncio
 import socket
 from unittest.mock import MagicMock, patch
 
@@ -7,6 +8,14 @@ import pytest
 
 from service_watchdog.config import ServiceConfig
 from service_watchdog.monitor import ServiceController, ServiceMonitor, ServiceStatus
+from service_watchdog import monitor as monitor_module
+
+
+@pytest.fixture(autouse=True)
+def clear_url_cache():
+    """Health responses are cached per URL; keep tests isolated."""
+    monitor_module._URL_CACHE.clear()
+    yield
 
 
 class TestServiceStatus:
@@ -81,12 +90,12 @@ class TestServiceMonitor:
         finally:
             sock.close()
 
-    @patch("service_watchdog.monitor.requests.get")
-    def test_check_by_health_url_success(self, mock_get):
+    @patch("service_watchdog.monitor._http_session")
+    def test_check_by_health_url_success(self, mock_session):
         """Check service by health URL - success."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_get.return_value = mock_response
+        mock_session.return_value.get.return_value = mock_response
 
         config = ServiceConfig(
             name="test",
@@ -99,12 +108,12 @@ class TestServiceMonitor:
         assert status.running is True
         assert status.check_method == "health_url"
 
-    @patch("service_watchdog.monitor.requests.get")
-    def test_check_by_health_url_failure(self, mock_get):
+    @patch("service_watchdog.monitor._http_session")
+    def test_check_by_health_url_failure(self, mock_session):
         """Check service by health URL - failure."""
         mock_response = MagicMock()
         mock_response.status_code = 500
-        mock_get.return_value = mock_response
+        mock_session.return_value.get.return_value = mock_response
 
         config = ServiceConfig(
             name="test",
@@ -117,6 +126,58 @@ class TestServiceMonitor:
         assert status.running is False
         assert "500" in status.error
 
+    @patch("service_watchdog.monitor._http_session")
+    def test_check_by_health_url_coalesced(self, mock_session):
+        """Monitors sharing a health URL reuse one GET within the TTL."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_session.return_value.get.return_value = mock_response
+
+        config = ServiceConfig(
+            name="test",
+            health_url="http://localhost/health",
+            restart_command="restart.sh",
+        )
+
+        assert ServiceMonitor(config).check().running is True
+        assert ServiceMonitor(config).check().running is True
+
+        assert mock_session.return_value.get.call_count == 1
+
+    def test_check_async_by_port_closed(self):
+        """Async check reports a closed port like the sync path."""
+        config = ServiceConfig(
+            name="test",
+            port=59999,  # Unlikely to be in use
+            restart_command="restart.sh",
+        )
+        monitor = ServiceMonitor(config)
+        status = asyncio.run(monitor.check_async())
+
+        assert status.running is False
+        assert status.check_method == "port"
+        assert "not listening" in status.error.lower()
+
+    def test_check_ports_batch(self):
+        """Batch port probe checks open and closed ports concurrently."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+        sock.listen(1)
+
+        try:
+            open_config = ServiceConfig(name="open", port=port, restart_command="restart.sh")
+            closed_config = ServiceConfig(name="closed", port=59999, restart_command="restart.sh")
+            monitors = [ServiceMonitor(open_config), ServiceMonitor(closed_config)]
+
+            results = ServiceMonitor.check_ports_batch(monitors, timeout=2.0)
+
+            assert results["open"] is True
+            assert results["closed"] is False
+        finally:
+            sock.close()
+
     def test_check_by_pid_file_missing(self):
         """Check service by PID file when file doesn't exist."""
         config = ServiceConfig(
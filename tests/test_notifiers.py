@@ -1,5 +1,6 @@
 """Tests for notification plugins."""
 
+import json
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -8,10 +9,13 @@ import pytest
 from service_watchdog.config import NotifierConfig
 from service_watchdog.monitor import ServiceStatus
 from service_watchdog.notifiers import (
+    BaseNotifier,
+    EmailNotifier,
     NotificationEvent,
     NotifierFactory,
     SlackNotifier,
     TelegramNotifier,
+    TokenBucket,
     WebhookNotifier,
 )
 
@@ -89,20 +93,64 @@ class TestTelegramNotifier:
         assert notifier.should_notify(failure_event) is True
         assert notifier.should_notify(recovery_event) is False
 
-    @patch("service_watchdog.notifiers.requests.post")
-    def test_send_success(self, mock_post):
-        """Send Telegram notification successfully."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_post.return_value = mock_response
-
+    def test_send_missing_credentials(self):
+        """Fail when credentials missing."""
         config = NotifierConfig(
             type="telegram",
             enabled=True,
-            bot_token="123:ABC",
-            chat_id="12345",
+            bot_token=None,
+            chat_id=None,
         )
         notifier = TelegramNotifier(config)
+        event = NotificationEvent(
+            event_type=NotificationEvent.FAILURE,
+            service_name="test",
+            message="Failed",
+        )
+
+        success, message = notifier.send(event)
+
+        assert success is False
+        assert "required" in message.lower()
+
+
+class TestHTTPNotifierSend:
+    """Test the send path shared by the HTTP-based notifiers."""
+
+    @pytest.mark.parametrize(
+        ("notifier_cls", "config_kwargs", "session_method"),
+        [
+            (
+                TelegramNotifier,
+                {"type": "telegram", "bot_token": "123:ABC", "chat_id": "12345"},
+                "post",
+            ),
+            (
+                SlackNotifier,
+                {"type": "slack", "webhook_url": "https://hooks.slack.com/xxx"},
+                "post",
+            ),
+            (
+                WebhookNotifier,
+                {
+                    "type": "webhook",
+                    "url": "https://example.com/hook",
+                    "method": "POST",
+                    "headers": {"Authorization": "Bearer token"},
+                },
+                "request",
+            ),
+        ],
+    )
+    @patch("service_watchdog.notifiers._http_session")
+    def test_send_success(self, mock_session, notifier_cls, config_kwargs, session_method):
+        """Each HTTP notifier reports success on a 2xx response."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_call = getattr(mock_session.return_value, session_method)
+        mock_call.return_value = mock_response
+
+        notifier = notifier_cls(NotifierConfig(enabled=True, **config_kwargs))
         event = NotificationEvent(
             event_type=NotificationEvent.FAILURE,
             service_name="test-service",
@@ -112,39 +160,62 @@ class TestTelegramNotifier:
         success, message = notifier.send(event)
 
         assert success is True
-        mock_post.assert_called_once()
-        call_args = mock_post.call_args
-        assert "123:ABC" in call_args[0][0]
+        mock_call.assert_called_once()
+        call_args = mock_call.call_args
+        if notifier_cls is TelegramNotifier:
+            assert "123:ABC" in call_args[0][0]
+        elif notifier_cls is WebhookNotifier:
+            assert call_args[1]["method"] == "POST"
+            assert "Authorization" in call_args[1]["headers"]
+
+
+class TestTokenBucket:
+    """Test outbound rate limiting."""
+
+    def test_drops_when_exhausted(self):
+        """try_acquire returns False once the burst capacity is spent."""
+        # Refill rate low enough that no token comes back during the test
+        bucket = TokenBucket(rate=0.001, capacity=2)
+
+        assert bucket.try_acquire() is True
+        assert bucket.try_acquire() is True
+        assert bucket.try_acquire() is False
+
+    @patch("service_watchdog.notifiers._http_session")
+    def test_send_dropped_when_rate_limited(self, mock_session):
+        """A rate-limited notifier drops the message instead of blocking."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_session.return_value.post.return_value = mock_response
 
-    def test_send_missing_credentials(self):
-        """Fail when credentials missing."""
         config = NotifierConfig(
-            type="telegram",
+            type="slack",
             enabled=True,
-            bot_token=None,
-            chat_id=None,
-        )
-        notifier = TelegramNotifier(config)
-        event = NotificationEvent(
-            event_type=NotificationEvent.FAILURE,
-            service_name="test",
-            message="Failed",
+            webhook_url="https://hooks.slack.com/xxx",
+            rate_limit=0.001,
+            burst=1,
         )
+        notifier = SlackNotifier(config)
+        event = NotificationEvent(NotificationEvent.FAILURE, "test", "Failed")
+
+        assert notifier.send(event)[0] is True
 
         success, message = notifier.send(event)
 
         assert success is False
-        assert "required" in message.lower()
+        assert "rate limit" in message.lower()
+        assert mock_session.return_value.post.call_count == 1
 
 
-class TestSlackNotifier:
-    """Test Slack notification plugin."""
+class TestSendBatch:
+    """Test the batched delivery path used by the daemon's flush."""
 
-    @patch("service_watchdog.notifiers.requests.post")
-    def test_send_success(self, mock_post):
-        """Send Slack notification successfully."""
+    @patch("service_watchdog.notifiers._http_session")
+    def test_slack_batches_into_one_call(self, mock_session):
+        """Slack combines all events into a single webhook call."""
         mock_response = MagicMock()
         mock_response.status_code = 200
+        mock_post = mock_session.return_value.post
         mock_post.return_value = mock_response
 
         config = NotifierConfig(
@@ -153,15 +224,98 @@ class TestSlackNotifier:
             webhook_url="https://hooks.slack.com/xxx",
         )
         notifier = SlackNotifier(config)
-        event = NotificationEvent(
-            event_type=NotificationEvent.FAILURE,
-            service_name="test-service",
-            message="Service failed",
+        events = [
+            NotificationEvent(NotificationEvent.FAILURE, f"service-{i}", "Failed")
+            for i in range(3)
+        ]
+
+        success, message = notifier.send_batch(events)
+
+        assert success is True
+        mock_post.assert_called_once()
+        payload = json.loads(mock_post.call_args[1]["data"])
+        assert len(payload["attachments"]) == 3
+
+    @patch("service_watchdog.notifiers._http_session")
+    def test_telegram_chunks_at_message_limit(self, mock_session):
+        """Telegram splits a batch that exceeds the 4096-character limit."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_post = mock_session.return_value.post
+        mock_post.return_value = mock_response
+
+        config = NotifierConfig(
+            type="telegram",
+            enabled=True,
+            bot_token="123:ABC",
+            chat_id="12345",
         )
+        notifier = TelegramNotifier(config)
+        # Three ~3000-character messages cannot share one 4096-character
+        # chunk, so the batch must go out as multiple posts
+        events = [
+            NotificationEvent(NotificationEvent.FAILURE, "test", "x" * 3000)
+            for _ in range(3)
+        ]
 
-        success, message = notifier.send(event)
+        success, message = notifier.send_batch(events)
+
+        assert success is True
+        assert mock_post.call_count > 1
+        for call in mock_post.call_args_list:
+            assert len(call[1]["data"]["text"]) <= TelegramNotifier.MAX_MESSAGE_LEN
+
+    @patch("service_watchdog.notifiers._http_session")
+    def test_webhook_keeps_per_event_payloads(self, mock_session):
+        """Webhook batches go out as one bare event dict per request."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_request = mock_session.return_value.request
+        mock_request.return_value = mock_response
+
+        config = NotifierConfig(
+            type="webhook",
+            enabled=True,
+            url="https://example.com/hook",
+        )
+        notifier = WebhookNotifier(config)
+        events = [
+            NotificationEvent(NotificationEvent.FAILURE, f"service-{i}", "Failed")
+            for i in range(2)
+        ]
+
+        success, message = notifier.send_batch(events)
 
         assert success is True
+        assert mock_request.call_count == 2
+        payload = json.loads(mock_request.call_args[1]["data"])
+        assert payload["service_name"] == "service-1"
+        assert "events" not in payload
+
+    def test_base_fallback_aggregates_failures(self):
+        """The default send_batch loops send() and aggregates failures."""
+
+        class FlakyNotifier(BaseNotifier):
+            def send(self, event):
+                if event.service_name == "bad":
+                    return False, "boom"
+                return True, "ok"
+
+        notifier = FlakyNotifier(NotifierConfig(type="flaky", enabled=True))
+        events = [
+            NotificationEvent(NotificationEvent.FAILURE, name, "Failed")
+            for name in ("good", "bad", "also-good")
+        ]
+
+        success, message = notifier.send_batch(events)
+
+        assert success is False
+        assert "1/3" in message
+        assert "boom" in message
+
+
+class TestSlackNotifier:
+    """Test Slack notification plugin."""
 
     def test_color_mapping(self):
         """Verify color mapping for different event types."""
@@ -177,37 +331,39 @@ class TestSlackNotifier:
         assert notifier.config.type == "slack"
 
 
-class TestWebhookNotifier:
-    """Test generic webhook notification plugin."""
+class TestEmailNotifier:
+    """Test the persistent-SMTP email plugin."""
 
-    @patch("service_watchdog.notifiers.requests.request")
-    def test_send_post(self, mock_request):
-        """Send POST webhook notification."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_request.return_value = mock_response
+    def test_reconnects_when_connection_dead(self):
+        """A dead cached connection is replaced before sending."""
+        import smtplib
 
         config = NotifierConfig(
-            type="webhook",
+            type="email",
             enabled=True,
-            url="https://example.com/hook",
-            method="POST",
-            headers={"Authorization": "Bearer token"},
-        )
-        notifier = WebhookNotifier(config)
-        event = NotificationEvent(
-            event_type=NotificationEvent.RESTART,
-            service_name="test-service",
-            message="Restarted",
+            smtp_host="smtp.example.com",
+            from_addr="watchdog@example.com",
+            to_addrs=["ops@example.com"],
         )
-
+        notifier = EmailNotifier(config)
+
+        # Cached connection the server has dropped: the NOOP health
+        # check fails, forcing a reconnect
+        dead = MagicMock()
+        dead.noop.side_effect = smtplib.SMTPServerDisconnected("lost")
+        fresh = MagicMock()
+        notifier._smtplib = MagicMock(SMTPException=smtplib.SMTPException)
+        notifier._smtplib.SMTP.return_value = fresh
+        notifier._smtp = dead
+
+        event = NotificationEvent(NotificationEvent.FAILURE, "test", "Failed")
         success, message = notifier.send(event)
 
         assert success is True
-        mock_request.assert_called_once()
-        call_kwargs = mock_request.call_args[1]
-        assert call_kwargs["method"] == "POST"
-        assert "Authorization" in call_kwargs["headers"]
+        notifier._smtplib.SMTP.assert_called_once()
+        fresh.starttls.assert_called_once()
+        fresh.sendmail.assert_called_once()
+        dead.sendmail.assert_not_called()
 
 
 class TestNotifierFactory: